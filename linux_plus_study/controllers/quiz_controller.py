@@ -261,9 +261,9 @@ class QuizController:
         self.game_state.update_points(points_earned)
         
         # Update history
-        if 0 <= original_index < len(self.game_state.questions):
-            original_question_text = self.game_state.questions[original_index][0]
-            self.game_state.update_history(original_question_text, category, is_correct)
+        original_question = self.game_state.question_manager.get_question_by_index(original_index)
+        if original_question is not None:
+            self.game_state.update_history(original_question.text, category, is_correct)
         
         # Check achievements
         new_badges = self.game_state.check_achievements(is_correct, self.current_streak)
@@ -461,12 +461,14 @@ class QuizController:
         
         # Use date as seed for consistent daily question
         date_hash = int(hashlib.md5(today.encode()).hexdigest()[:8], 16)
-        if self.game_state.questions:
-            question_index = date_hash % len(self.game_state.questions)
+        question_count = self.game_state.get_question_count()
+        if question_count:
+            question_index = date_hash % question_count
             self.last_daily_challenge_date = today
+            question = self.game_state.question_manager.get_question_by_index(question_index)
             
             return {
-                'question_data': self.game_state.questions[question_index],
+                'question_data': question.to_tuple(),
                 'original_index': question_index,
                 'is_daily_challenge': True,
                 'date': today
@@ -567,11 +569,7 @@ class QuizController:
     
     def _get_available_questions_count(self, category_filter=None):
         """Get count of available questions for the filter."""
-        if category_filter is None:
-            return len(self.game_state.questions)
-        else:
-            return sum(1 for q in self.game_state.questions 
-                      if len(q) > 3 and q[3] == category_filter)
+        return self.game_state.get_question_count(category_filter)
     
     def _get_quick_fire_remaining(self):
         """Get remaining Quick Fire questions and time."""
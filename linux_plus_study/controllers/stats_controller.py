@@ -314,16 +314,13 @@ class StatsController:
         questions_to_review = []
         missing_questions = []
         
+        questions_by_text = self.game_state.get_question_tuples_by_text()
+        
         for incorrect_text in incorrect_list:
-            found = False
-            for q_data in self.game_state.questions:
-                if (isinstance(q_data, (list, tuple)) and 
-                    len(q_data) > 0 and q_data[0] == incorrect_text):
-                    questions_to_review.append(q_data)
-                    found = True
-                    break
-            
-            if not found:
+            q_data = questions_by_text.get(incorrect_text)
+            if q_data is not None:
+                questions_to_review.append(q_data)
+            else:
                 missing_questions.append(incorrect_text)
         
         return {
@@ -108,6 +108,7 @@ def launch_cli_interface(game_state):
         game_state: GameState instance
     """
     try:
+        init_cli_colors()
         cli_view = LinuxPlusStudyCLI(game_state)
         cli_view.display_welcome_message()
         cli_view.main_menu()
@@ -174,13 +175,8 @@ def launch_web_interface(game_state):
 def main():
     """Main entry point for the Linux+ Study Game."""
     
-    # Initialize colorama if available
-    try:
-        if 'colorama' in sys.modules:
-            import colorama
-            colorama.init(autoreset=True)
-    except Exception as e:
-        print(f"Warning: Failed to initialize colorama: {e}")
+    # The welcome line and interface prompt are colored, so set up colorama first
+    init_cli_colors()
     
     # Initialize game state
     try:
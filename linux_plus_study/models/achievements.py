@@ -10,6 +10,7 @@ import json
 import os
 from datetime import datetime
 from utils.config import *
+from utils.database import load_json_file, save_json_file
 
 
 class AchievementSystem:
@@ -35,9 +36,8 @@ class AchievementSystem:
             dict: Achievement data with default structure if file doesn't exist
         """
         try:
-            with open(self.achievements_file, 'r', encoding='utf-8') as f:
-                achievements = json.load(f)
-                
+            achievements = load_json_file(self.achievements_file)
+            
             # Ensure all required keys exist
             default_achievements = self._get_default_achievements()
             for key, default_value in default_achievements.items():
@@ -65,9 +65,8 @@ class AchievementSystem:
             if isinstance(achievements_copy.get("days_studied"), set):
                 achievements_copy["days_studied"] = list(achievements_copy["days_studied"])
             
-            with open(self.achievements_file, 'w', encoding='utf-8') as f:
-                json.dump(achievements_copy, f, indent=2)
-                
+            save_json_file(achievements_copy, self.achievements_file, pretty=False)
+            
         except Exception as e:
             print(f"Error saving achievements: {e}")
     
@@ -108,7 +107,6 @@ class AchievementSystem:
         Returns:
             list: List of newly earned badge names
         """
-        new_badges = []
         today = datetime.now().date().isoformat()
         
         # Add today to days studied
@@ -122,30 +120,20 @@ class AchievementSystem:
         else:
             self.achievements["questions_answered"] = self.achievements.get("questions_answered", 0) + 1
         
-        # Check for streak master achievement
-        if (streak_count >= 5 and 
-            "streak_master" not in self.achievements["badges"]):
-            new_badges.append("streak_master")
-            self.achievements["badges"].append("streak_master")
-            self.achievements["streaks_achieved"] = self.achievements.get("streaks_achieved", 0) + 1
+        # Badge -> whether its condition is met; award the missing ones in one pass
+        badges = self.achievements["badges"]
+        earned = set(badges)
+        candidates = (
+            ("streak_master", streak_count >= 5),
+            ("dedicated_learner", len(self.achievements["days_studied"]) >= 3),
+            ("century_club", self.achievements["questions_answered"] >= 100),
+            ("point_collector", self.achievements["points_earned"] >= 500),
+        )
+        new_badges = [name for name, met in candidates if met and name not in earned]
+        badges.extend(new_badges)
         
-        # Check for dedicated learner achievement
-        if (len(self.achievements["days_studied"]) >= 3 and 
-            "dedicated_learner" not in self.achievements["badges"]):
-            new_badges.append("dedicated_learner")
-            self.achievements["badges"].append("dedicated_learner")
-        
-        # Check for century club achievement
-        if (self.achievements["questions_answered"] >= 100 and 
-            "century_club" not in self.achievements["badges"]):
-            new_badges.append("century_club")
-            self.achievements["badges"].append("century_club")
-        
-        # Check for point collector achievement
-        if (self.achievements["points_earned"] >= 500 and 
-            "point_collector" not in self.achievements["badges"]):
-            new_badges.append("point_collector")
-            self.achievements["badges"].append("point_collector")
+        if "streak_master" in new_badges:
+            self.achievements["streaks_achieved"] = self.achievements.get("streaks_achieved", 0) + 1
         
         return new_badges
     
@@ -14,6 +14,7 @@ from datetime import datetime
 from typing import Optional, Dict, List, Tuple, Any
 
 from utils.config import *
+from utils.database import load_json_file, save_json_file
 from models.question import QuestionManager
 from models.achievements import AchievementSystem
 
@@ -94,8 +95,7 @@ class GameState:
             Dict: Study history data with default structure if file doesn't exist
         """
         try:
-            with open(self.history_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
+            history = load_json_file(self.history_file)
             
             # Ensure all default keys exist
             default = self._default_history()
@@ -128,8 +128,7 @@ class GameState:
             # Update leaderboard in history before saving
             self.study_history["leaderboard"] = self.achievement_system.leaderboard
             
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.study_history, f, indent=2)
+            save_json_file(self.study_history, self.history_file, pretty=False)
         except IOError as e:
             print(f"Error saving history: {e}")
         except Exception as e:
@@ -180,6 +179,9 @@ class GameState:
         if not isinstance(q_stats.get("history"), list):
             q_stats["history"] = []
         q_stats["history"].append({"timestamp": timestamp, "correct": is_correct})
+        # Keep a recent window; older attempts are already counted in the totals
+        if len(q_stats["history"]) > QUESTION_HISTORY_LIMIT:
+            del q_stats["history"][:-QUESTION_HISTORY_LIMIT]
         
         # Category specific stats
         cat_stats = history.setdefault("categories", {}).setdefault(
@@ -309,10 +311,12 @@ class GameState:
         import hashlib
         date_hash = int(hashlib.md5(today.encode()).hexdigest()[:8], 16)
         
-        if self.questions:
-            question_index = date_hash % len(self.questions)
+        question_count = self.question_manager.get_question_count()
+        if question_count:
+            question_index = date_hash % question_count
             self.last_daily_challenge_date = today
-            return self.questions[question_index], question_index
+            question = self.question_manager.get_question_by_index(question_index)
+            return question.to_tuple(), question_index
         
         return None, -1
     
@@ -397,6 +401,22 @@ class GameState:
         """
         return self.question_manager.get_question_count(category_filter)
     
+    def get_question_tuples_by_text(self) -> Dict[str, Tuple]:
+        """
+        Get all questions in tuple format, keyed by question text.
+        
+        Built in a single pass so callers resolving many stored question
+        texts (e.g. the incorrect-review list) do one lookup per entry
+        instead of rescanning the pool each time.
+        
+        Returns:
+            Dict[str, Tuple]: Question tuples by text; the first occurrence wins
+        """
+        lookup = {}
+        for question in self.question_manager.questions:
+            lookup.setdefault(question.text, question.to_tuple())
+        return lookup
+    
     def get_categories_list(self) -> List[str]:
         """
         Get sorted list of question categories.
@@ -456,7 +476,7 @@ class GameState:
             export_data["achievements"] = self.achievement_system.achievements
             export_data["export_metadata"] = {
                 "export_date": datetime.now().isoformat(),
-                "total_questions_in_pool": len(self.questions),
+                "total_questions_in_pool": self.question_manager.get_question_count(),
                 "categories_available": list(self.categories)
             }
             
@@ -520,7 +540,7 @@ class GameState:
             'achievements': achievement_stats,
             'session': session_stats,
             'question_pool': {
-                'total_questions': len(self.questions),
+                'total_questions': self.question_manager.get_question_count(),
                 'categories_available': len(self.categories),
                 'categories': list(self.categories)
             }
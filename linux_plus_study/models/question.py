@@ -9,14 +9,19 @@ and intelligent question selection with weighting.
 import json
 import random
 import os
+import sys
 from datetime import datetime
 from typing import List, Tuple, Optional, Dict, Any
 from utils.config import SAMPLE_QUESTIONS
+from utils.database import load_json_file
 
 
 class Question:
     """Represents a single quiz question."""
     
+    # The pool holds every question in memory; slots drop the per-instance dict
+    __slots__ = ("text", "options", "correct_index", "category", "explanation")
+    
     def __init__(self, text: str, options: List[str], correct_index: int, 
                  category: str, explanation: str = ""):
         """
@@ -32,7 +37,8 @@ class Question:
         self.text = text
         self.options = options
         self.correct_index = correct_index
-        self.category = category
+        # Interned: categories repeat across many questions and are compared often
+        self.category = sys.intern(category) if isinstance(category, str) else category
         self.explanation = explanation
         
         # Validate the question data
@@ -174,10 +180,15 @@ class QuestionManager:
     
     def __init__(self):
         """Initialize the question manager."""
+        # Change the pool only through load_questions, add_question and
+        # remove_question, which keep the category index in step with it
         self.questions: List[Question] = []
         self.categories: set = set()
         self.answered_indices_session: List[int] = []
         
+        # Category -> question indices, like a secondary index on category
+        self._category_index: Dict[str, List[int]] = {}
+        
         # Load questions from various sources
         self.load_questions()
     
@@ -204,13 +215,14 @@ class QuestionManager:
         json_files_to_try = [
             "linux_plus_questions.json",
             "data/questions.json",
-            os.path.join("data", "questions.json"),
             "questions.json"
         ]
+        file_exists = {}
         
         for json_file in json_files_to_try:
             try:
-                if os.path.exists(json_file):
+                file_exists[json_file] = os.path.exists(json_file)
+                if file_exists[json_file]:
                     print(f"📁 Found questions file: {json_file}")
                     additional_questions = self._load_from_json_file(json_file)
                     if additional_questions:
@@ -238,7 +250,7 @@ class QuestionManager:
             print("🔍 Checked locations:")
             for json_file in json_files_to_try:
                 abs_path = os.path.abspath(json_file)
-                exists = "✓" if os.path.exists(json_file) else "✗"
+                exists = "✓" if file_exists.get(json_file) else "✗"
                 print(f"   {exists} {abs_path}")
             
             # Create minimal fallback questions if none found
@@ -256,7 +268,8 @@ class QuestionManager:
         random.shuffle(self.questions)
         
         # Update categories set
-        self.categories = set(q.category for q in self.questions)
+        self._rebuild_category_index()
+        self.categories = set(self._category_index)
         
         # Final status report
         print(f"\n📊 Question Loading Summary:")
@@ -279,8 +292,7 @@ class QuestionManager:
         """
         questions = []
         
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(filename)
         
         # Handle different JSON formats
         if isinstance(data, list):
@@ -315,6 +327,25 @@ class QuestionManager:
         
         return questions
     
+    def _rebuild_category_index(self):
+        """Rebuild the category -> question indices lookup from the pool."""
+        category_index: Dict[str, List[int]] = {}
+        for idx, question in enumerate(self.questions):
+            category_index.setdefault(question.category, []).append(idx)
+        self._category_index = category_index
+    
+    def _category_indices(self, category: str) -> List[int]:
+        """
+        Get the indices of all questions in a category, in pool order.
+        
+        Args:
+            category (str): Category name
+            
+        Returns:
+            List[int]: Question indices (do not modify)
+        """
+        return self._category_index.get(category, [])
+    
     def get_question_count(self, category_filter: Optional[str] = None) -> int:
         """
         Get count of available questions.
@@ -328,7 +359,7 @@ class QuestionManager:
         if category_filter is None:
             return len(self.questions)
         
-        return sum(1 for q in self.questions if q.category == category_filter)
+        return len(self._category_indices(category_filter))
     
     def get_categories(self) -> List[str]:
         """
@@ -352,18 +383,19 @@ class QuestionManager:
             Tuple[Optional[Question], int]: Selected question and its index, or (None, -1) if none available
         """
         # Get possible question indices
-        possible_indices = [
-            idx for idx, q in enumerate(self.questions)
-            if (category_filter is None or q.category == category_filter)
-        ]
+        if category_filter is None:
+            possible_indices = range(len(self.questions))
+        else:
+            possible_indices = self._category_indices(category_filter)
         
         if not possible_indices:
             return None, -1
         
-        # Filter out questions answered this session
+        # Filter out questions answered this session (set: O(1) per probe)
+        answered = set(self.answered_indices_session)
         available_indices = [
             idx for idx in possible_indices 
-            if idx not in self.answered_indices_session
+            if idx not in answered
         ]
         
         # If all questions in category have been answered this session, return None
@@ -452,10 +484,7 @@ class QuestionManager:
         Returns:
             List[Tuple[Question, int]]: List of (question, index) tuples
         """
-        return [
-            (question, idx) for idx, question in enumerate(self.questions)
-            if question.category == category
-        ]
+        return [(self.questions[idx], idx) for idx in self._category_indices(category)]
     
     def add_question(self, question: Question) -> int:
         """
@@ -469,7 +498,9 @@ class QuestionManager:
         """
         self.questions.append(question)
         self.categories.add(question.category)
-        return len(self.questions) - 1
+        index = len(self.questions) - 1
+        self._category_index.setdefault(question.category, []).append(index)
+        return index
     
     def remove_question(self, index: int) -> bool:
         """
@@ -484,8 +515,11 @@ class QuestionManager:
         if 0 <= index < len(self.questions):
             removed_question = self.questions.pop(index)
             
+            # Later indices shift down by one
+            self._rebuild_category_index()
+            
             # Update categories if this was the last question in its category
-            if not any(q.category == removed_question.category for q in self.questions):
+            if removed_question.category not in self._category_index:
                 self.categories.discard(removed_question.category)
             
             # Update answered indices to account for removed question
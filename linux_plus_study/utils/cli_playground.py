@@ -4,14 +4,179 @@ CLI Playground utility for simulating Linux commands in the GUI.
 Provides a safe, educational terminal simulation environment.
 """
 
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from functools import lru_cache
+from itertools import groupby
+from typing import Dict, List, Optional, Tuple, Any
 import subprocess
 import os
+import fnmatch
 import json
+import re
 import shlex
+import stat
 from pathlib import Path
 
+from utils.config import FILE_VALIDATION
+
+
+# Static output of the simulated system-information commands
+_PS_OUTPUT = '''  PID TTY          TIME CMD
+ 1234 pts/0    00:00:01 bash
+ 5678 pts/0    00:00:00 python
+ 9012 pts/0    00:00:00 ps'''
+
+_DF_OUTPUT = '''Filesystem     1K-blocks    Used Available Use% Mounted on
+/dev/sda1       20480000 8192000  11264000  42% /
+tmpfs            2048000  102400   1945600   5% /dev/shm'''
+
+_FREE_OUTPUT = '''              total        used        free      shared  buff/cache   available
+Mem:        8192000     2048000     4096000      102400     2048000     5632000
+Swap:       2048000           0     2048000'''
+
+_UPTIME_OUTPUT = ' 15:30:42 up 2 days,  4:30,  1 user,  load average: 0.15, 0.10, 0.05'
+
+_HELP_OUTPUT = '''Linux+ Study CLI Playground - Commands Reference
+
+    ═══════════════════════════════════════════════════════════════════
+
+    BASIC COMMANDS:
+    help                    - Shows this help message
+    clear                   - Clears the terminal screen
+    ls [-l] [path]          - Lists files and directories
+    pwd                     - Shows current directory
+    cd [directory]          - Changes directory
+    cat [file]              - Displays file contents
+    mkdir [directory]       - Creates directory
+    touch [file]            - Creates empty file
+    rm [file]               - Removes file
+    cp [source] [dest]      - Copies file
+    mv [source] [dest]      - Moves/renames file
+    grep [pattern] [file]   - Searches for pattern
+    echo [text]             - Displays text output
+    find [path]             - Finds files and directories
+    whoami                  - Shows current user
+    date                    - Shows current date
+    history                 - Shows command history
+
+    SYSTEM INFORMATION:
+    uname [-a]              - System information
+    ps [aux]                - Shows running processes
+    top                     - Shows system resource usage
+    df [-h]                 - Shows disk usage
+    free [-h]               - Shows memory usage
+    uptime                  - Shows system uptime
+
+    TEXT PROCESSING:
+    head [file]             - Shows first 10 lines
+    tail [file]             - Shows last 10 lines
+    wc [file]               - Counts lines, words, characters
+    sort [file]             - Sorts file contents
+    uniq [file]             - Removes duplicate lines
+
+    LINUX+ SPECIFIC COMMANDS:
+    grub2-install [device]  - Installs GRUB2 bootloader
+    grub2-mkconfig [-o]     - Generates GRUB config
+    update-grub             - Updates GRUB (Debian-based)
+    mkinitrd [args]         - Creates initrd image
+    dracut [args]           - Creates initramfs image
+    nmap [options] [host]   - Network scanning
+    systemctl [action] [service] - Service management
+    journalctl [options]    - View system logs
+    firewall-cmd [options]  - Firewall management
+    iptables [options]      - Advanced firewall rules
+    lsmod                   - Lists loaded kernel modules
+    modprobe [module]       - Loads kernel module
+    lsblk                   - Lists block devices
+    fdisk [options]         - Disk partitioning
+    mount [device] [point]  - Mounts filesystem
+    umount [device]         - Unmounts filesystem
+
+    ═══════════════════════════════════════════════════════════════════
+
+    SAMPLE FILES: sample.txt, data.csv, notes.md, log.txt
+
+    QUICK EXAMPLES:
+    ls                      → List files in current directory
+    cat sample.txt          → View sample file contents  
+    grep INFO log.txt       → Search for "INFO" in log file
+    systemctl status nginx  → Check nginx service status
+    nmap localhost          → Scan local machine ports
+
+    This is a safe educational sandbox environment for practicing Linux commands.
+    Type any command above to get started with hands-on learning!'''
+
+
+_WC_CHUNK_SIZE = 1 << 20  # 1 MiB
+_HISTORY_SIZE = 20  # Commands kept for the history command
+
+
+def _read_text(file_path: str) -> str:
+    """Read a whole text file from a plain string path."""
+    with open(file_path, 'r') as f:
+        return f.read()
+
+
+def _wc_counts(file_path: str) -> Tuple[int, int, int]:
+    """
+    Count lines, words and bytes of a file in a single chunked pass.
+
+    Memory use is bounded by the chunk size regardless of file size.
+
+    Returns:
+        Tuple[int, int, int]: (lines, words, bytes)
+    """
+    lines = words = chars = 0
+    in_word = False
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_WC_CHUNK_SIZE), b''):
+            lines += chunk.count(b'\n')
+            chars += len(chunk)
+            words += len(chunk.split())
+            if in_word and not chunk[:1].isspace():
+                words -= 1  # Word continues from the previous chunk
+            in_word = not chunk[-1:].isspace()
+    return lines, words, chars
+
+
+def _parse_n_args(args: List[str], default: int = 10) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Parse head/tail style arguments: [-n N | -nN] [file].
+    
+    Args:
+        args (List[str]): Command arguments
+        default (int): Line count when no -n option is given
+        
+    Returns:
+        Tuple[Optional[int], Optional[str]]: (line count, filename). The line
+        count is None if the -n value is not a non-negative integer; the filename is
+        None if no file was given.
+    """
+    lines = default
+    if args and args[0].startswith('-n'):
+        value, args = args[0][2:], args[1:]
+        if not value and args:
+            value, args = args[0], args[1:]
+        try:
+            lines = int(value)
+        except ValueError:
+            return None, None
+        if lines < 0:
+            return None, None
+    return lines, (args[0] if args else None)
+
+
+@lru_cache(maxsize=64)
+def _compile_grep(pattern: str) -> re.Pattern:
+    """Compile a literal, case-insensitive grep pattern (cached per pattern)."""
+    return re.compile(re.escape(pattern), re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """Compile a shell glob into a case-sensitive regex (cached per pattern)."""
+    return re.compile(fnmatch.translate(pattern))
 
 
 class CLIPlayground:
@@ -22,8 +187,8 @@ class CLIPlayground:
         self.current_directory = "/home/user"
         self.username = "user"
         self.hostname = "linux-playground"
-        self.command_history = []
-        self.command_history = []
+        # Only the most recent commands are ever shown, so keep just those
+        self.command_history = deque(maxlen=_HISTORY_SIZE)
         self.current_directory = os.getcwd()
         self.safe_commands = {
             'ls': self._cmd_ls,
@@ -49,9 +214,51 @@ class CLIPlayground:
             'help': self._cmd_help
         }
         
+        # Handlers for process_command, built once instead of per call
+        self.command_handlers = {
+            "help": self._handle_help,
+            "clear": self._handle_clear,
+            "ls": self._handle_ls,
+            "pwd": self._handle_pwd,
+            "whoami": self._handle_whoami,
+            "date": self._handle_date,
+            "uname": self._handle_uname,
+            "cat": self._handle_cat,
+            "cd": self._handle_cd,
+            "mkdir": self._handle_mkdir,
+            "touch": self._handle_touch,
+            "rm": self._handle_rm,
+            "cp": self._handle_cp,
+            "mv": self._handle_mv,
+            "grep": self._handle_grep,
+            "ps": self._handle_ps,
+            "top": self._handle_top,
+            "df": self._handle_df,
+            "free": self._handle_free,
+            "history": self._handle_history,
+            # Linux+ specific commands
+            "grub2-install": self._handle_grub2_install,
+            "grub2-mkconfig": self._handle_grub2_mkconfig,
+            "update-grub": self._handle_update_grub,
+            "mkinitrd": self._handle_mkinitrd,
+            "dracut": self._handle_dracut,
+            "nmap": self._handle_nmap,
+            "systemctl": self._handle_systemctl,
+            "journalctl": self._handle_journalctl,
+            "firewall-cmd": self._handle_firewall_cmd,
+            "iptables": self._handle_iptables,
+            "lsmod": self._handle_lsmod,
+            "modprobe": self._handle_modprobe,
+            "lsblk": self._handle_lsblk,
+            "fdisk": self._handle_fdisk,
+            "mount": self._handle_mount,
+            "umount": self._handle_umount,
+        }
+        
         # Create a safe sandbox directory
         self.sandbox_dir = Path.cwd() / "cli_sandbox"
         self.sandbox_dir.mkdir(exist_ok=True)
+        self._sandbox_str = os.fspath(self.sandbox_dir)
         
         # Initialize sample files
         self._create_sample_files()
@@ -113,50 +320,10 @@ class CLIPlayground:
         args = parts[1:] if len(parts) > 1 else []
         
         # Dispatch to appropriate handler
-        command_handlers = {
-            "help": self._handle_help,
-            "clear": self._handle_clear,
-            "ls": self._handle_ls,
-            "pwd": self._handle_pwd,
-            "whoami": self._handle_whoami,
-            "date": self._handle_date,
-            "uname": self._handle_uname,
-            "cat": self._handle_cat,
-            "cd": self._handle_cd,
-            "mkdir": self._handle_mkdir,
-            "touch": self._handle_touch,
-            "rm": self._handle_rm,
-            "cp": self._handle_cp,
-            "mv": self._handle_mv,
-            "grep": self._handle_grep,
-            "ps": self._handle_ps,
-            "top": self._handle_top,
-            "df": self._handle_df,
-            "free": self._handle_free,
-            "history": self._handle_history,
-            # Linux+ specific commands
-            "grub2-install": self._handle_grub2_install,
-            "grub2-mkconfig": self._handle_grub2_mkconfig,
-            "update-grub": self._handle_update_grub,
-            "mkinitrd": self._handle_mkinitrd,
-            "dracut": self._handle_dracut,
-            "nmap": self._handle_nmap,
-            "systemctl": self._handle_systemctl,
-            "journalctl": self._handle_journalctl,
-            "firewall-cmd": self._handle_firewall_cmd,
-            "iptables": self._handle_iptables,
-            "lsmod": self._handle_lsmod,
-            "modprobe": self._handle_modprobe,
-            "lsblk": self._handle_lsblk,
-            "fdisk": self._handle_fdisk,
-            "mount": self._handle_mount,
-            "umount": self._handle_umount,
-        }
-        
-        if command in command_handlers:
-            return command_handlers[command](args)
-        else:
+        handler = self.command_handlers.get(command)
+        if handler is None:
             return f"-bash: {command}: command not found"
+        return handler(args)
     def _handle_help(self, args: List[str]) -> str:
         """Handle the help command."""
         return (
@@ -385,10 +552,7 @@ class CLIPlayground:
     
     def _handle_history(self, args: List[str]) -> str:
         """Handle the history command."""
-        result = ""
-        for i, cmd in enumerate(self.command_history[-20:], 1):  # Show last 20 commands
-            result += f"  {i:3d}  {cmd}\n"
-        return result.rstrip()
+        return "\n".join(f"  {i:3d}  {cmd}" for i, cmd in enumerate(self.command_history, 1))
     
     # Linux+ Specific Commands
     
@@ -650,9 +814,10 @@ class CLIPlayground:
             }
         
         # Execute safe command
-        if cmd_name in self.safe_commands:
+        handler = self.safe_commands.get(cmd_name)
+        if handler is not None:
             try:
-                result = self.safe_commands[cmd_name](args)
+                result = handler(args)
                 return {
                     'output': result,
                     'error': '',
@@ -674,6 +839,34 @@ class CLIPlayground:
                 'command': command
             }
     
+    def _resolve_sandbox_file(self, cmd: str, filename: str) -> Tuple[Optional[str], str]:
+        """
+        Resolve a sandbox file for a text command with a single stat call.
+        
+        Rejects missing files, directories and files larger than
+        FILE_VALIDATION["max_file_size"] before anything is read.
+        
+        Args:
+            cmd (str): Command name used to prefix error messages
+            filename (str): File name relative to the sandbox
+            
+        Returns:
+            Tuple[Optional[str], str]: (file path, "") or (None, error message)
+        """
+        file_path = os.path.join(self._sandbox_str, filename)
+        try:
+            st = os.stat(file_path)
+        except (OSError, ValueError):
+            return None, f'{cmd}: {filename}: No such file or directory'
+        
+        if stat.S_ISDIR(st.st_mode):
+            return None, f'{cmd}: {filename}: Is a directory'
+        
+        if st.st_size > FILE_VALIDATION["max_file_size"]:
+            return None, f'{cmd}: {filename}: file too large'
+        
+        return file_path, ''
+    
     def _cmd_ls(self, args: List[str]) -> str:
         """List directory contents"""
         target_dir = self.sandbox_dir
@@ -691,8 +884,8 @@ class CLIPlayground:
                 # Long format
                 output = []
                 for file in files:
-                    stat = file.stat()
-                    size = stat.st_size
+                    st = file.stat()
+                    size = st.st_size
                     name = file.name
                     file_type = 'd' if file.is_dir() else '-'
                     output.append(f'{file_type}rw-r--r-- 1 user user {size:8d} {name}')
@@ -728,74 +921,53 @@ class CLIPlayground:
             return 'cat: missing filename'
         
         filename = args[0]
-        file_path = self.sandbox_dir / filename
-        
-        if not file_path.exists():
-            return f'cat: {filename}: No such file or directory'
-        
-        if not file_path.is_file():
-            return f'cat: {filename}: Is a directory'
+        file_path, error = self._resolve_sandbox_file('cat', filename)
+        if error:
+            return error
         
         try:
-            return file_path.read_text()
+            return _read_text(file_path)
         except Exception as e:
             return f'cat: {filename}: {e}'
     
     def _cmd_head(self, args: List[str]) -> str:
         """Display first lines of file"""
-        if not args:
-            return 'head: missing filename'
-        
-        filename = args[0]
-        lines = 10  # default
-        
-        if len(args) > 1 and args[0] == '-n':
-            try:
-                lines = int(args[1])
-                filename = args[2] if len(args) > 2 else None
-            except (ValueError, IndexError):
-                return 'head: invalid number of lines'
+        lines, filename = _parse_n_args(args)
+        if lines is None:
+            return 'head: invalid number of lines'
         
         if not filename:
             return 'head: missing filename'
         
-        file_path = self.sandbox_dir / filename
-        
-        if not file_path.exists():
-            return f'head: {filename}: No such file or directory'
+        file_path, error = self._resolve_sandbox_file('head', filename)
+        if error:
+            return error
         
         try:
-            content = file_path.read_text()
-            return '\n'.join(content.split('\n')[:lines])
+            content = _read_text(file_path)
+            return '\n'.join(content.splitlines()[:lines])
         except Exception as e:
             return f'head: {filename}: {e}'
     
     def _cmd_tail(self, args: List[str]) -> str:
         """Display last lines of file"""
-        if not args:
-            return 'tail: missing filename'
-        
-        filename = args[0]
-        lines = 10  # default
-        
-        if len(args) > 1 and args[0] == '-n':
-            try:
-                lines = int(args[1])
-                filename = args[2] if len(args) > 2 else None
-            except (ValueError, IndexError):
-                return 'tail: invalid number of lines'
+        lines, filename = _parse_n_args(args)
+        if lines is None:
+            return 'tail: invalid number of lines'
         
         if not filename:
             return 'tail: missing filename'
         
-        file_path = self.sandbox_dir / filename
-        
-        if not file_path.exists():
-            return f'tail: {filename}: No such file or directory'
+        file_path, error = self._resolve_sandbox_file('tail', filename)
+        if error:
+            return error
         
         try:
-            content = file_path.read_text()
-            return '\n'.join(content.split('\n')[-lines:])
+            # Stream through a bounded deque so only the last lines are kept
+            with open(file_path, 'r') as f:
+                output = ''.join(deque(f, maxlen=lines))
+            # Drop only the final newline; blank lines inside the window stay
+            return output[:-1] if output.endswith('\n') else output
         except Exception as e:
             return f'tail: {filename}: {e}'
     
@@ -806,31 +978,28 @@ class CLIPlayground:
         
         pattern = args[0]
         filename = args[1]
-        file_path = self.sandbox_dir / filename
-        
-        if not file_path.exists():
-            return f'grep: {filename}: No such file or directory'
+        file_path, error = self._resolve_sandbox_file('grep', filename)
+        if error:
+            return error
         
         try:
-            content = file_path.read_text()
-            matching_lines = []
-            for line in content.split('\n'):
-                if pattern.lower() in line.lower():
-                    matching_lines.append(line)
-            return '\n'.join(matching_lines) if matching_lines else ''
+            content = _read_text(file_path)
+            search = _compile_grep(pattern).search
+            return '\n'.join(line for line in content.splitlines() if search(line))
         except Exception as e:
             return f'grep: {filename}: {e}'
     
     def _cmd_find(self, args: List[str]) -> str:
         """Find files"""
+        # DirEntry caches the type from the directory read, so no stat per file
         if not args:
-            files = list(self.sandbox_dir.iterdir())
-            return '\n'.join([f'./{f.name}' for f in files if f.is_file()])
+            with os.scandir(self.sandbox_dir) as entries:
+                return '\n'.join(f'./{e.name}' for e in entries if e.is_file())
         
         if args[0] == '-name' and len(args) > 1:
-            pattern = args[1].strip('"\'')
-            files = list(self.sandbox_dir.glob(pattern))
-            return '\n'.join([f'./{f.name}' for f in files])
+            match = _compile_glob(args[1].strip('"\'')).match
+            with os.scandir(self.sandbox_dir) as entries:
+                return '\n'.join(f'./{e.name}' for e in entries if match(e.name))
         
         return 'find: simple usage only - try "find" or "find -name pattern"'
     
@@ -840,16 +1009,12 @@ class CLIPlayground:
             return 'wc: missing filename'
         
         filename = args[0]
-        file_path = self.sandbox_dir / filename
-        
-        if not file_path.exists():
-            return f'wc: {filename}: No such file or directory'
+        file_path, error = self._resolve_sandbox_file('wc', filename)
+        if error:
+            return error
         
         try:
-            content = file_path.read_text()
-            lines = len(content.split('\n'))
-            words = len(content.split())
-            chars = len(content)
+            lines, words, chars = _wc_counts(file_path)
             return f'{lines:8d} {words:8d} {chars:8d} {filename}'
         except Exception as e:
             return f'wc: {filename}: {e}'
@@ -860,16 +1025,14 @@ class CLIPlayground:
             return 'sort: missing filename'
         
         filename = args[0]
-        file_path = self.sandbox_dir / filename
-        
-        if not file_path.exists():
-            return f'sort: {filename}: No such file or directory'
+        file_path, error = self._resolve_sandbox_file('sort', filename)
+        if error:
+            return error
         
         try:
-            content = file_path.read_text()
-            lines = content.split('\n')
-            sorted_lines = sorted(lines)
-            return '\n'.join(sorted_lines)
+            lines = _read_text(file_path).splitlines()
+            lines.sort()
+            return '\n'.join(lines)
         except Exception as e:
             return f'sort: {filename}: {e}'
     
@@ -879,27 +1042,18 @@ class CLIPlayground:
             return 'uniq: missing filename'
         
         filename = args[0]
-        file_path = self.sandbox_dir / filename
-        
-        if not file_path.exists():
-            return f'uniq: {filename}: No such file or directory'
+        file_path, error = self._resolve_sandbox_file('uniq', filename)
+        if error:
+            return error
         
         try:
-            content = file_path.read_text()
-            lines = content.split('\n')
-            unique_lines = []
-            prev_line = None
-            for line in lines:
-                if line != prev_line:
-                    unique_lines.append(line)
-                prev_line = line
-            return '\n'.join(unique_lines)
+            content = _read_text(file_path)
+            return '\n'.join(line for line, _ in groupby(content.splitlines()))
         except Exception as e:
             return f'uniq: {filename}: {e}'
     
     def _cmd_date(self, args: List[str]) -> str:
         """Display current date"""
-        from datetime import datetime
         return datetime.now().strftime('%a %b %d %H:%M:%S %Z %Y')
     
     def _cmd_whoami(self, args: List[str]) -> str:
@@ -908,38 +1062,23 @@ class CLIPlayground:
     
     def _cmd_ps(self, args: List[str]) -> str:
         """Display processes (simulated)"""
-        return '''  PID TTY          TIME CMD
- 1234 pts/0    00:00:01 bash
- 5678 pts/0    00:00:00 python
- 9012 pts/0    00:00:00 ps'''
+        return _PS_OUTPUT
     
     def _cmd_df(self, args: List[str]) -> str:
         """Display filesystem usage (simulated)"""
-        return '''Filesystem     1K-blocks    Used Available Use% Mounted on
-/dev/sda1       20480000 8192000  11264000  42% /
-tmpfs            2048000  102400   1945600   5% /dev/shm'''
+        return _DF_OUTPUT
     
     def _cmd_free(self, args: List[str]) -> str:
         """Display memory usage (simulated)"""
-        return 
-    '''              total        used        free      shared  buff/cache   available
-Mem:        8192000     2048000     4096000      102400     2048000     5632000
-Swap:       2048000           0     2048000
-'''
+        return _FREE_OUTPUT
     
     def _cmd_uptime(self, args: List[str]) -> str:
         """Display system uptime (simulated)"""
-        return ' 15:30:42 up 2 days,  4:30,  1 user,  load average: 0.15, 0.10, 0.05'
+        return _UPTIME_OUTPUT
     
     def _cmd_history(self, args: List[str]) -> str:
         """Display command history"""
-        if not self.command_history:
-            return ''
-        
-        output = []
-        for i, cmd in enumerate(self.command_history[-20:], 1):  # Last 20 commands
-            output.append(f'{i:5d}  {cmd}')
-        return '\n'.join(output)
+        return '\n'.join(f'{i:5d}  {cmd}' for i, cmd in enumerate(self.command_history, 1))
     
     def _cmd_clear(self, args: List[str]) -> str:
         """Clear screen command"""
@@ -947,76 +1086,18 @@ Swap:       2048000           0     2048000
     
     def _cmd_help(self, args: List[str]) -> str:
         """Handle the help command for web interface."""
-        return '''Linux+ Study CLI Playground - Commands Reference
-
-    ═══════════════════════════════════════════════════════════════════
-
-    BASIC COMMANDS:
-    help                    - Shows this help message
-    clear                   - Clears the terminal screen
-    ls [-l] [path]          - Lists files and directories
-    pwd                     - Shows current directory
-    cd [directory]          - Changes directory
-    cat [file]              - Displays file contents
-    mkdir [directory]       - Creates directory
-    touch [file]            - Creates empty file
-    rm [file]               - Removes file
-    cp [source] [dest]      - Copies file
-    mv [source] [dest]      - Moves/renames file
-    grep [pattern] [file]   - Searches for pattern
-    echo [text]             - Displays text output
-    find [path]             - Finds files and directories
-    whoami                  - Shows current user
-    date                    - Shows current date
-    history                 - Shows command history
-
-    SYSTEM INFORMATION:
-    uname [-a]              - System information
-    ps [aux]                - Shows running processes
-    top                     - Shows system resource usage
-    df [-h]                 - Shows disk usage
-    free [-h]               - Shows memory usage
-    uptime                  - Shows system uptime
-
-    TEXT PROCESSING:
-    head [file]             - Shows first 10 lines
-    tail [file]             - Shows last 10 lines
-    wc [file]               - Counts lines, words, characters
-    sort [file]             - Sorts file contents
-    uniq [file]             - Removes duplicate lines
+        return _HELP_OUTPUT
 
-    LINUX+ SPECIFIC COMMANDS:
-    grub2-install [device]  - Installs GRUB2 bootloader
-    grub2-mkconfig [-o]     - Generates GRUB config
-    update-grub             - Updates GRUB (Debian-based)
-    mkinitrd [args]         - Creates initrd image
-    dracut [args]           - Creates initramfs image
-    nmap [options] [host]   - Network scanning
-    systemctl [action] [service] - Service management
-    journalctl [options]    - View system logs
-    firewall-cmd [options]  - Firewall management
-    iptables [options]      - Advanced firewall rules
-    lsmod                   - Lists loaded kernel modules
-    modprobe [module]       - Loads kernel module
-    lsblk                   - Lists block devices
-    fdisk [options]         - Disk partitioning
-    mount [device] [point]  - Mounts filesystem
-    umount [device]         - Unmounts filesystem
-
-    ═══════════════════════════════════════════════════════════════════
-
-    SAMPLE FILES: sample.txt, data.csv, notes.md, log.txt
-
-    QUICK EXAMPLES:
-    ls                      → List files in current directory
-    cat sample.txt          → View sample file contents  
-    grep INFO log.txt       → Search for "INFO" in log file
-    systemctl status nginx  → Check nginx service status
-    nmap localhost          → Scan local machine ports
-
-    This is a safe educational sandbox environment for practicing Linux commands.
-    Type any command above to get started with hands-on learning!'''
+_playground = None
 
 def get_cli_playground():
-    """Get CLI playground instance"""
-    return CLIPlayground()
\ No newline at end of file
+    """
+    Get the shared CLI playground instance.
+
+    The sandbox directory and sample files are created on first use rather
+    than when the web view module is imported.
+    """
+    global _playground
+    if _playground is None:
+        _playground = CLIPlayground()
+    return _playground
\ No newline at end of file
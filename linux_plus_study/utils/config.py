@@ -6,6 +6,8 @@ Configuration constants for the Linux+ Study Game.
 import sys
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
 
 # --- File Constants ---
 HISTORY_FILE = "linux_plus_history.json"
@@ -21,6 +23,9 @@ POINTS_PER_INCORRECT = -2
 STREAK_BONUS_THRESHOLD = 3
 STREAK_BONUS_MULTIPLIER = 1.5
 
+# --- History Constants ---
+QUESTION_HISTORY_LIMIT = 50  # Most recent attempts kept per question
+
 # --- Quick Fire Mode Constants ---
 QUICK_FIRE_QUESTIONS = 5
 QUICK_FIRE_TIME_LIMIT = 180  # 3 minutes in seconds
@@ -41,101 +46,180 @@ ACHIEVEMENTS_FILE = PROJECT_ROOT / "linux_plus_achievements.json"
 HISTORY_FILE = PROJECT_ROOT / "linux_plus_history.json"
 WEB_SETTINGS_FILE = PROJECT_ROOT / "web_settings.json"
 
+# Environment, read once per process
+_get = os.environ.get
+_FLASK_ENV = _get("FLASK_ENV")
+_IS_PRODUCTION = _get("PRODUCTION") == "true"
+
 # Application modes (GUI mode removed)
-SUPPORTED_MODES = ["cli", "web"]
+SUPPORTED_MODES = frozenset(("cli", "web"))
+SUPPORTED_MODES_ORDER = ("cli", "web")  # For help text and menus
 DEFAULT_MODE = "cli"
 
 
 # --- Colorama Setup (CLI Colors) ---
+# Palette keys mapped to the colorama (namespace, attribute) they come from
+_PALETTE = {
+    "reset": ("Style", "RESET_ALL"),
+    "bold": ("Style", "BRIGHT"),
+    "dim": ("Style", "DIM"),
+    # Foreground Colors
+    "fg_black": ("Fore", "BLACK"),
+    "fg_red": ("Fore", "RED"),
+    "fg_green": ("Fore", "GREEN"),
+    "fg_yellow": ("Fore", "YELLOW"),
+    "fg_blue": ("Fore", "BLUE"),
+    "fg_magenta": ("Fore", "MAGENTA"),
+    "fg_cyan": ("Fore", "CYAN"),
+    "fg_white": ("Fore", "WHITE"),
+    "fg_lightblack_ex": ("Fore", "LIGHTBLACK_EX"),
+    # Bright Foreground Colors
+    "fg_bright_red": ("Fore", "LIGHTRED_EX"),
+    "fg_bright_green": ("Fore", "LIGHTGREEN_EX"),
+    "fg_bright_yellow": ("Fore", "LIGHTYELLOW_EX"),
+    "fg_bright_blue": ("Fore", "LIGHTBLUE_EX"),
+    "fg_bright_magenta": ("Fore", "LIGHTMAGENTA_EX"),
+    "fg_bright_cyan": ("Fore", "LIGHTCYAN_EX"),
+    "fg_bright_white": ("Fore", "LIGHTWHITE_EX"),
+    # Background Colors
+    "bg_red": ("Back", "RED"),
+    "bg_green": ("Back", "GREEN"),
+    "bg_yellow": ("Back", "YELLOW"),
+    "bg_blue": ("Back", "BLUE"),
+    "bg_magenta": ("Back", "MAGENTA"),
+    "bg_cyan": ("Back", "CYAN"),
+    "bg_white": ("Back", "WHITE"),
+}
+
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Back/Style: every attribute is empty."""
+
+    def __getattr__(self, name):
+        return ""
+
+
+class _NoColorama:
+    """Stand-in for the colorama module when it is not installed."""
+    Fore = Back = Style = _NoColor()
+
+
 try:
-    import colorama
-    colorama.init(autoreset=True)
-    
-    # Define a richer color palette using colorama styles
-    C = {
-        "reset": colorama.Style.RESET_ALL,
-        "bold": colorama.Style.BRIGHT,
-        "dim": colorama.Style.DIM,
-        # Foreground Colors
-        "fg_black": colorama.Fore.BLACK,
-        "fg_red": colorama.Fore.RED,
-        "fg_green": colorama.Fore.GREEN,
-        "fg_yellow": colorama.Fore.YELLOW,
-        "fg_blue": colorama.Fore.BLUE,
-        "fg_magenta": colorama.Fore.MAGENTA,
-        "fg_cyan": colorama.Fore.CYAN,
-        "fg_white": colorama.Fore.WHITE,
-        "fg_lightblack_ex": colorama.Fore.LIGHTBLACK_EX,
-        # Bright Foreground Colors
-        "fg_bright_red": colorama.Fore.LIGHTRED_EX,
-        "fg_bright_green": colorama.Fore.LIGHTGREEN_EX,
-        "fg_bright_yellow": colorama.Fore.LIGHTYELLOW_EX,
-        "fg_bright_blue": colorama.Fore.LIGHTBLUE_EX,
-        "fg_bright_magenta": colorama.Fore.LIGHTMAGENTA_EX,
-        "fg_bright_cyan": colorama.Fore.LIGHTCYAN_EX,
-        "fg_bright_white": colorama.Fore.LIGHTWHITE_EX,
-        # Background Colors
-        "bg_red": colorama.Back.RED,
-        "bg_green": colorama.Back.GREEN,
-        "bg_yellow": colorama.Back.YELLOW,
-        "bg_blue": colorama.Back.BLUE,
-        "bg_magenta": colorama.Back.MAGENTA,
-        "bg_cyan": colorama.Back.CYAN,
-        "bg_white": colorama.Back.WHITE,
-    }
+    import colorama as _colorama
+except ImportError:
+    # Colors degrade to empty strings if colorama is not available
+    _colorama = _NoColorama()
+
+# Define a richer color palette using colorama styles
+C = {key: getattr(getattr(_colorama, group), attr) for key, (group, attr) in _PALETTE.items()}
+
+def _combo(*keys):
+    """Concatenate the palette codes for the given keys, in order."""
+    return "".join(C[key] for key in keys)
+
+# Define semantic colors using the palette
+COLOR_QUESTION = _combo("fg_bright_cyan", "bold")
+COLOR_OPTIONS = _combo("fg_white")
+COLOR_OPTION_NUM = _combo("fg_yellow", "bold")
+COLOR_CATEGORY = _combo("fg_bright_yellow", "bold")
+COLOR_CORRECT = _combo("fg_bright_green", "bold")
+COLOR_INCORRECT = _combo("fg_bright_red", "bold")
+COLOR_EXPLANATION = _combo("fg_lightblack_ex")
+COLOR_PROMPT = _combo("fg_bright_magenta", "bold")
+COLOR_HEADER = _combo("fg_bright_blue", "bold")
+COLOR_SUBHEADER = _combo("fg_blue", "bold")
+COLOR_STATS_LABEL = _combo("fg_white")
+COLOR_STATS_VALUE = _combo("fg_bright_yellow")
+COLOR_STATS_ACC_GOOD = _combo("fg_bright_green")
+COLOR_STATS_ACC_AVG = _combo("fg_yellow")
+COLOR_STATS_ACC_BAD = _combo("fg_bright_red")
+COLOR_BORDER = _combo("fg_blue")
+COLOR_INPUT = _combo("fg_bright_white")
+COLOR_ERROR = _combo("fg_white", "bg_red", "bold")
+COLOR_WARNING = _combo("fg_bright_yellow", "bold")
+COLOR_INFO = _combo("fg_bright_cyan")
+COLOR_WELCOME_BORDER = _combo("fg_bright_yellow", "bold")
+COLOR_WELCOME_TEXT = _combo("fg_white")
+COLOR_WELCOME_TITLE = _combo("fg_bright_yellow", "bold")
+COLOR_RESET = _combo("reset")
+
+
+# Single-slot "%s" templates so colored text is one format call, not a
+# chain of concatenations at every print site
+_FMT = {
+    kind: color + "%s" + COLOR_RESET
+    for kind, color in (
+        ("question", COLOR_QUESTION),
+        ("options", COLOR_OPTIONS),
+        ("option_num", COLOR_OPTION_NUM),
+        ("category", COLOR_CATEGORY),
+        ("correct", COLOR_CORRECT),
+        ("incorrect", COLOR_INCORRECT),
+        ("explanation", COLOR_EXPLANATION),
+        ("prompt", COLOR_PROMPT),
+        ("header", COLOR_HEADER),
+        ("subheader", COLOR_SUBHEADER),
+        ("error", COLOR_ERROR),
+        ("warning", COLOR_WARNING),
+        ("info", COLOR_INFO),
+    )
+}
+
+def wrap(kind, text):
+    """
+    Wrap text in the semantic color for the given kind.
     
-    # Define semantic colors using the palette
-    COLOR_QUESTION = C["fg_bright_cyan"] + C["bold"]
-    COLOR_OPTIONS = C["fg_white"]
-    COLOR_OPTION_NUM = C["fg_yellow"] + C["bold"]
-    COLOR_CATEGORY = C["fg_bright_yellow"] + C["bold"]
-    COLOR_CORRECT = C["fg_bright_green"] + C["bold"]
-    COLOR_INCORRECT = C["fg_bright_red"] + C["bold"]
-    COLOR_EXPLANATION = C["fg_lightblack_ex"]
-    COLOR_PROMPT = C["fg_bright_magenta"] + C["bold"]
-    COLOR_HEADER = C["fg_bright_blue"] + C["bold"]
-    COLOR_SUBHEADER = C["fg_blue"] + C["bold"]
-    COLOR_STATS_LABEL = C["fg_white"]
-    COLOR_STATS_VALUE = C["fg_bright_yellow"]
-    COLOR_STATS_ACC_GOOD = C["fg_bright_green"]
-    COLOR_STATS_ACC_AVG = C["fg_yellow"]
-    COLOR_STATS_ACC_BAD = C["fg_bright_red"]
-    COLOR_BORDER = C["fg_blue"]
-    COLOR_INPUT = C["fg_bright_white"]
-    COLOR_ERROR = C["fg_white"] + C["bg_red"] + C["bold"]
-    COLOR_WARNING = C["fg_bright_yellow"] + C["bold"]
-    COLOR_INFO = C["fg_bright_cyan"]
-    COLOR_WELCOME_BORDER = C["fg_bright_yellow"] + C["bold"]
-    COLOR_WELCOME_TEXT = C["fg_white"]
-    COLOR_WELCOME_TITLE = C["fg_bright_yellow"] + C["bold"]
-    COLOR_RESET = C["reset"]
+    Args:
+        kind (str): Semantic color name, e.g. "error" or "question"
+        text (str): Text to color
+        
+    Returns:
+        str: Colored text followed by a reset code
+    """
+    return _FMT[kind] % (text,)
+
+_colors_initialized = False
+
+def init_cli_colors():
+    """
+    Initialize colorama's terminal handling for CLI output.
     
-except ImportError:
-    print("Warning: Colorama not found. Colored output will be disabled in CLI.")
-    # Define empty strings if colorama is not available
-    C = {k: "" for k in ["reset", "bold", "dim", "fg_black", "fg_red", "fg_green", 
-         "fg_yellow", "fg_blue", "fg_magenta", "fg_cyan", "fg_white", "fg_lightblack_ex", 
-         "fg_bright_red", "fg_bright_green", "fg_bright_yellow", "fg_bright_blue", 
-         "fg_bright_magenta", "fg_bright_cyan", "fg_bright_white", "bg_red", "bg_green", 
-         "bg_yellow", "bg_blue", "bg_magenta", "bg_cyan", "bg_white"]}
+    Called by main() before the first colored terminal output and by
+    launch_cli_interface, rather than at import time, so importing the
+    package (e.g. by the web view) never installs the stream wrappers.
+    Safe to call more than once.
+    """
+    global _colors_initialized
+    if _colors_initialized:
+        return
+    _colors_initialized = True
     
-    COLOR_QUESTION, COLOR_OPTIONS, COLOR_OPTION_NUM, COLOR_CATEGORY = "", "", "", ""
-    COLOR_CORRECT, COLOR_INCORRECT, COLOR_EXPLANATION, COLOR_PROMPT = "", "", "", ""
-    COLOR_HEADER, COLOR_SUBHEADER, COLOR_STATS_LABEL, COLOR_STATS_VALUE = "", "", "", ""
-    COLOR_STATS_ACC_GOOD, COLOR_STATS_ACC_AVG, COLOR_STATS_ACC_BAD = "", "", ""
-    COLOR_BORDER, COLOR_INPUT, COLOR_ERROR, COLOR_WARNING, COLOR_INFO = "", "", "", "", ""
-    COLOR_WELCOME_BORDER, COLOR_WELCOME_TEXT, COLOR_WELCOME_TITLE = "", "", ""
-    COLOR_RESET = ""
+    try:
+        import colorama
+    except ImportError:
+        print("Warning: Colorama not found. Colored output will be disabled in CLI.")
+        return
+    colorama.init(autoreset=True)
 
 # --- Sample Questions Data ---
-SAMPLE_QUESTIONS = [
-    (
+class SampleQuestion(NamedTuple):
+    """Built-in question in the (text, options, correct_index, category, explanation) tuple format."""
+    text: str
+    options: list  # Kept a list; validate_question_data requires one
+    correct_index: int
+    category: str
+    explanation: str
+
+
+SAMPLE_QUESTIONS = (
+    SampleQuestion(
         "Which command installs the GRUB2 bootloader to a specified device?",
         ["grub2-mkconfig", "grub2-install", "update-grub", "dracut"],
         1, "Commands (System Management)",
         "`grub2-install` installs the GRUB2 bootloader files to the appropriate location and typically installs the boot code to the MBR or EFI partition. Example: `grub2-install /dev/sda` (for BIOS systems) or `grub2-install --target=x86_64-efi --efi-directory=/boot/efi` (for UEFI systems)."
-    )
-]
+    ),
+)
+
 # CLI Configuration Settings
 CLI_SETTINGS = {
     "welcome_message": "Welcome to Linux Plus Study Tool",
@@ -187,28 +271,32 @@ SCORING_SETTINGS = {
 }
 
 # Question Categories (Linux Plus specific)
-QUESTION_CATEGORIES = [
+# Interned so equality checks against question categories hit the identity fast path
+QUESTION_CATEGORIES_ORDER = tuple(map(sys.intern, (
     "Hardware and System Configuration",
-    "Systems Operation and Maintenance", 
+    "Systems Operation and Maintenance",
     "Security",
     "Linux Troubleshooting and Diagnostics",
     "Automation and Scripting",
-]
+)))
+QUESTION_CATEGORIES = frozenset(QUESTION_CATEGORIES_ORDER)  # For membership checks
 
 # Difficulty Levels
-DIFFICULTY_LEVELS = ["Beginner", "Intermediate", "Advanced", "Expert"]
+DIFFICULTY_LEVELS = [sys.intern(level) for level in ("Beginner", "Intermediate", "Advanced", "Expert")]
 
 # File validation settings
 FILE_VALIDATION = {
     "max_file_size": 50 * 1024 * 1024,  # 50MB
-    "allowed_extensions": [".json", ".txt", ".csv"],
+    "allowed_extensions": frozenset((".json", ".txt", ".csv")),  # Lowercase, for O(1) membership
     "encoding": "utf-8",
 }
 
 # Logging Configuration
+_LOG_FILE_PATH = str(PROJECT_ROOT / "app.log")  # Converted once; handlers take a str
+
 LOGGING_SETTINGS = {
     "log_level": "INFO",
-    "log_file": PROJECT_ROOT / "app.log",
+    "log_file": _LOG_FILE_PATH,
     "max_log_size": 10 * 1024 * 1024,  # 10MB
     "backup_count": 5,
     "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -276,21 +364,7 @@ def get_config_value(section, key, default=None):
     Returns:
         Configuration value or default
     """
-    config_sections = {
-        "cli": CLI_SETTINGS,
-        "web": WEB_SETTINGS,
-        "quiz": QUIZ_SETTINGS,
-        "achievements": ACHIEVEMENT_SETTINGS,
-        "scoring": SCORING_SETTINGS,
-        "logging": LOGGING_SETTINGS,
-        "debug": DEBUG_SETTINGS,
-        "api": API_SETTINGS,
-        "ui": UI_CONSTANTS,
-        "performance": PERFORMANCE_SETTINGS,
-    }
-    
-    section_config = config_sections.get(section, {})
-    return section_config.get(key, default)
+    return _FLAT_CONFIG.get((section, key), default)
 
 def validate_mode(mode):
     """
@@ -304,6 +378,14 @@ def validate_mode(mode):
     """
     return mode in SUPPORTED_MODES
 
+# File type -> path, as returned by get_file_path
+_FILE_PATHS = {
+    "questions": QUESTIONS_FILE,
+    "achievements": ACHIEVEMENTS_FILE,
+    "history": HISTORY_FILE,
+    "web_settings": WEB_SETTINGS_FILE,
+}
+
 def get_file_path(file_type):
     """
     Get the full file path for a specific file type.
@@ -314,37 +396,77 @@ def get_file_path(file_type):
     Returns:
         Path: Full path to the specified file
     """
-    file_paths = {
-        "questions": QUESTIONS_FILE,
-        "achievements": ACHIEVEMENTS_FILE,
-        "history": HISTORY_FILE,
-        "web_settings": WEB_SETTINGS_FILE,
-    }
-    
-    return file_paths.get(file_type)
+    return _FILE_PATHS.get(file_type)
+
+# Directories created by ensure_directories, parents before children
+_REQUIRED_DIRS = (
+    DATA_DIR,
+    TEMPLATES_DIR,
+    STATIC_DIR,
+    STATIC_DIR / "css",
+    STATIC_DIR / "js",
+)
+
+_dirs_ready = False
 
 def ensure_directories():
     """
     Ensure all required directories exist.
-    Create them if they don't exist.
+    Create them if they don't exist. Only the first call touches the
+    filesystem; later calls return immediately.
     """
-    directories = [
-        DATA_DIR,
-        TEMPLATES_DIR,
-        STATIC_DIR,
-        STATIC_DIR / "css",
-        STATIC_DIR / "js",
-    ]
+    global _dirs_ready
+    if _dirs_ready:
+        return
     
-    for directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
+    for directory in _REQUIRED_DIRS:
+        # One stat() covers the common already-exists case
+        if not os.path.isdir(directory):
+            directory.mkdir(parents=True, exist_ok=True)
+    _dirs_ready = True
 
 # Environment-specific overrides
-if os.getenv("FLASK_ENV") == "development":
+if _FLASK_ENV == "development":
     WEB_SETTINGS["debug_mode"] = True
     DEBUG_SETTINGS["verbose_logging"] = True
 
-if os.getenv("PRODUCTION") == "true":
+if _IS_PRODUCTION:
     WEB_SETTINGS["debug_mode"] = False
     DEBUG_SETTINGS["verbose_logging"] = False
-    LOGGING_SETTINGS["log_level"] = "WARNING"
\ No newline at end of file
+    LOGGING_SETTINGS["log_level"] = "WARNING"
+
+# Settings are read-only from here on; expose them as immutable views
+CLI_SETTINGS = MappingProxyType(CLI_SETTINGS)
+WEB_SETTINGS = MappingProxyType(WEB_SETTINGS)
+QUIZ_SETTINGS = MappingProxyType(QUIZ_SETTINGS)
+ACHIEVEMENT_SETTINGS = MappingProxyType(ACHIEVEMENT_SETTINGS)
+SCORING_SETTINGS = MappingProxyType(SCORING_SETTINGS)
+LOGGING_SETTINGS = MappingProxyType(LOGGING_SETTINGS)
+DEBUG_SETTINGS = MappingProxyType(DEBUG_SETTINGS)
+API_SETTINGS = MappingProxyType(API_SETTINGS)
+UI_CONSTANTS = MappingProxyType(UI_CONSTANTS)
+PERFORMANCE_SETTINGS = MappingProxyType(PERFORMANCE_SETTINGS)
+
+
+# Section name -> settings dict, as addressed by get_config_value
+_CONFIG_SECTIONS = {
+    "cli": CLI_SETTINGS,
+    "web": WEB_SETTINGS,
+    "quiz": QUIZ_SETTINGS,
+    "achievements": ACHIEVEMENT_SETTINGS,
+    "scoring": SCORING_SETTINGS,
+    "logging": LOGGING_SETTINGS,
+    "debug": DEBUG_SETTINGS,
+    "api": API_SETTINGS,
+    "ui": UI_CONSTANTS,
+    "performance": PERFORMANCE_SETTINGS,
+}
+
+# Flattened (section, key) -> value lookup for get_config_value, built once
+# after the environment overrides above have been applied. This acts as the
+# memo table: a lookup is a single hash probe with no per-call setup.
+_FLAT_CONFIG = {
+    (section, key): value
+    for section, settings in _CONFIG_SECTIONS.items()
+    for key, value in settings.items()
+}
@@ -5,13 +5,191 @@ Handles loading and saving of history, achievements, questions, and exports.
 """
 
 import json
+import mmap
 import os
+import shutil
+from contextlib import contextmanager
 from datetime import datetime
 from utils.config import (
     HISTORY_FILE, ACHIEVEMENTS_FILE, SAMPLE_QUESTIONS,
     COLOR_INFO, COLOR_ERROR, COLOR_WARNING, COLOR_RESET
 )
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to ujson, then the standard library json module
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Files at least this large are memory-mapped rather than read into a buffer
+MMAP_THRESHOLD = 64 * 1024
+
+# Stdlib encoders keyed by (pretty, ensure_ascii), built once and reused.
+# encode() runs the C encoder for compact output, which json.dump never does.
+_JSON_ENCODERS = {
+    (pretty, ensure_ascii): json.JSONEncoder(
+        indent=2 if pretty else None,
+        separators=None if pretty else (',', ':'),
+        ensure_ascii=ensure_ascii
+    )
+    for pretty in (True, False)
+    for ensure_ascii in (True, False)
+}
+
+
+def load_json_file(path):
+    """
+    Read and decode a JSON file, using orjson or ujson when installed.
+    
+    With orjson, files of MMAP_THRESHOLD bytes or more are parsed straight
+    from a read-only memory map instead of being copied into a bytes object.
+    
+    Args:
+        path (str): Path to the JSON file
+        
+    Returns:
+        Decoded JSON data
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON, whichever parser is used
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    if ujson is not None:
+        with open(path, 'rb') as f:
+            content = f.read()
+        try:
+            return ujson.loads(content)
+        except ValueError as e:
+            # ujson's error is a plain ValueError; callers expect json.JSONDecodeError
+            raise json.JSONDecodeError(str(e), '', 0) from e
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@contextmanager
+def _atomic_open(path, mode='w'):
+    """
+    Open a temporary file that replaces path only once writing succeeds.
+    
+    Args:
+        path (str): Destination file path
+        mode (str): 'w' for text (UTF-8) or 'wb' for bytes
+        
+    Yields:
+        file: Handle to the temporary file
+    """
+    path = os.fspath(path)
+    # A unique temp file per write, so concurrent saves never share one.
+    # Exclusive create ('x') never reuses a file and keeps the normal umask.
+    tmp_path = f"{path}.{os.urandom(8).hex()}.tmp"
+    f = open(tmp_path, mode.replace('w', 'x'), encoding=None if 'b' in mode else 'utf-8')
+    try:
+        with f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Keep the previous file intact and discard the partial write
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def save_json_file(data, path, ensure_ascii=True, pretty=True):
+    """
+    Encode data as JSON and write it to a file.
+    
+    The data is written to a temporary file next to the destination and then
+    moved into place with os.replace, so a crash or encoding error mid-write
+    never leaves a truncated file behind.
+    
+    Args:
+        data: JSON-serializable data
+        path (str): Destination file path
+        ensure_ascii (bool): Escape non-ASCII characters (ujson and stdlib only;
+            orjson always writes UTF-8)
+        pretty (bool): Indent with two spaces; False writes compact JSON for
+            files that are only read back by the program
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        content = orjson.dumps(data, option=option)
+        with _atomic_open(path, 'wb') as f:
+            f.write(content)
+    elif ujson is not None:
+        with _atomic_open(path) as f:
+            ujson.dump(data, f, indent=2 if pretty else 0, ensure_ascii=ensure_ascii,
+                       escape_forward_slashes=False)
+    else:
+        content = _JSON_ENCODERS[pretty, ensure_ascii].encode(data)
+        with _atomic_open(path) as f:
+            f.write(content)
+
+
+# Column names produced by _normalize_questions
+_QUESTION_COLUMNS = ("index", "text", "options", "correct", "category", "explanation")
+
+
+def _normalize_questions(questions_data):
+    """
+    Split well-formed question tuples into parallel column lists.
+    
+    Tuples with fewer than five fields are dropped here, once, so the two
+    Markdown sections can zip the columns without re-checking every item.
+    The JSON export streams from the tuples instead and does not use this.
+    
+    Args:
+        questions_data (list): List of question tuples
+        
+    Returns:
+        dict: Lists keyed by _QUESTION_COLUMNS; "index" holds each question's
+            position in questions_data
+    """
+    rows = [(i, *q_data[:5]) for i, q_data in enumerate(questions_data) if len(q_data) >= 5]
+    if not rows:
+        return {column: [] for column in _QUESTION_COLUMNS}
+    return dict(zip(_QUESTION_COLUMNS, map(list, zip(*rows))))
+
+
+def _question_export_dict(index, q_data):
+    """
+    Build the export representation of a single question tuple.
+    
+    Args:
+        index (int): Position of the question in the pool
+        q_data (tuple): (question, options, correct_index, category, explanation)
+        
+    Returns:
+        dict: Question fields plus the resolved correct answer
+    """
+    question_text, options, correct_answer_index, category, explanation = q_data
+    valid_index = 0 <= correct_answer_index < len(options)
+    return {
+        "id": index + 1,
+        "question": question_text,
+        "category": category,
+        "options": options,
+        "correct_answer_index": correct_answer_index,
+        "correct_answer_letter": chr(ord('A') + correct_answer_index) if valid_index else "Invalid",
+        "correct_answer_text": options[correct_answer_index] if valid_index else "Invalid index",
+        "explanation": explanation if explanation else ""
+    }
+
 
 class DatabaseManager:
     """Handles all file I/O operations for the study game."""
@@ -29,26 +207,25 @@ class DatabaseManager:
             dict: Study history data
         """
         try:
-            with open(history_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-                
-                # Ensure all default keys exist if default_history_func provided
-                if default_history_func:
-                    default = default_history_func()
-                    for key, default_value in default.items():
-                        history.setdefault(key, default_value)
+            history = load_json_file(history_file)
+            
+            # Ensure all default keys exist if default_history_func provided
+            if default_history_func:
+                default = default_history_func()
+                for key, default_value in default.items():
+                    history.setdefault(key, default_value)
+            
+            # Basic type validation
+            if not isinstance(history.get("questions"), dict): 
+                history["questions"] = {}
+            if not isinstance(history.get("categories"), dict): 
+                history["categories"] = {}
+            if not isinstance(history.get("sessions"), list): 
+                history["sessions"] = []
+            if not isinstance(history.get("incorrect_review"), list): 
+                history["incorrect_review"] = []
                 
-                # Basic type validation
-                if not isinstance(history.get("questions"), dict): 
-                    history["questions"] = {}
-                if not isinstance(history.get("categories"), dict): 
-                    history["categories"] = {}
-                if not isinstance(history.get("sessions"), list): 
-                    history["sessions"] = []
-                if not isinstance(history.get("incorrect_review"), list): 
-                    history["incorrect_review"] = []
-                    
-                return history
+            return history
                 
         except (FileNotFoundError, json.JSONDecodeError):
             print(f"{COLOR_INFO} History file not found or invalid. Starting fresh. {COLOR_RESET}")
@@ -72,8 +249,7 @@ class DatabaseManager:
             bool: True if successful, False otherwise
         """
         try:
-            with open(history_file, 'w', encoding='utf-8') as f:
-                json.dump(history_data, f, indent=2)
+            save_json_file(history_data, history_file, pretty=False)
             return True
             
         except IOError as e:
@@ -96,8 +272,7 @@ class DatabaseManager:
             dict: Achievements data
         """
         try:
-            with open(achievements_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json_file(achievements_file)
                 
         except (FileNotFoundError, json.JSONDecodeError):
             return {
@@ -127,8 +302,7 @@ class DatabaseManager:
             if isinstance(achievements_copy.get("days_studied"), set):
                 achievements_copy["days_studied"] = list(achievements_copy["days_studied"])
             
-            with open(achievements_file, 'w', encoding='utf-8') as f:
-                json.dump(achievements_copy, f, indent=2)
+            save_json_file(achievements_copy, achievements_file, pretty=False)
             return True
             
         except Exception as e:
@@ -151,10 +325,9 @@ class DatabaseManager:
         
         # Try to load additional questions from file
         try:
-            with open(questions_file, 'r', encoding='utf-8') as f:
-                file_questions = json.load(f)
-                if isinstance(file_questions, list):
-                    all_questions.extend(file_questions)
+            file_questions = load_json_file(questions_file)
+            if isinstance(file_questions, list):
+                all_questions.extend(file_questions)
                     
         except (FileNotFoundError, json.JSONDecodeError):
             print(f"{COLOR_INFO} No additional questions file found. Using built-in questions. {COLOR_RESET}")
@@ -181,8 +354,7 @@ class DatabaseManager:
         
         try:
             export_path = os.path.abspath(filename)
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(history_data, f, indent=2)
+            save_json_file(history_data, filename)
             return True, export_path
             
         except IOError as e:
@@ -211,45 +383,44 @@ class DatabaseManager:
         try:
             export_path = os.path.abspath(filename)
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                # Write Questions Section
-                f.write("# Questions\n\n")
-                for i, q_data in enumerate(questions_data):
-                    if len(q_data) < 5:
-                        continue
-                    question_text, options, _, category, _ = q_data
-                    f.write(f"**Q{i+1}.** ({category})\n")
-                    f.write(f"{question_text}\n")
-                    for j, option in enumerate(options):
-                        f.write(f"   {chr(ord('A') + j)}. {option}\n")
-                    f.write("\n")
+            columns = _normalize_questions(questions_data)
+            indices = columns["index"]
+            all_options = columns["options"]
+            
+            # Build the document in memory and write it in one call
+            parts = []
+            append = parts.append
+            
+            # Questions Section
+            append("# Questions\n\n")
+            for i, question_text, options, category in zip(
+                    indices, columns["text"], all_options, columns["category"]):
+                append(f"**Q{i+1}.** ({category})\n{question_text}\n")
+                for j, option in enumerate(options):
+                    append(f"   {chr(ord('A') + j)}. {option}\n")
+                append("\n")
 
-                f.write("---\n\n")
+            append("---\n\n")
 
-                # Write Answers Section
-                f.write("# Answers\n\n")
-                for i, q_data in enumerate(questions_data):
-                    if len(q_data) < 5:
-                        continue
-                    _, options, correct_answer_index, _, explanation = q_data
+            # Answers Section
+            append("# Answers\n\n")
+            for i, options, correct_answer_index, explanation in zip(
+                    indices, all_options, columns["correct"], columns["explanation"]):
+                if 0 <= correct_answer_index < len(options):
+                    correct_option_letter = chr(ord('A') + correct_answer_index)
+                    correct_option_text = options[correct_answer_index]
                     
-                    if 0 <= correct_answer_index < len(options):
-                        correct_option_letter = chr(ord('A') + correct_answer_index)
-                        correct_option_text = options[correct_answer_index]
-                        
-                        f.write(f"**A{i+1}.** {correct_option_letter}. {correct_option_text}\n")
-                        if explanation:
-                            explanation_lines = explanation.split('\n')
-                            f.write("   *Explanation:*")
-                            first_line = True
-                            for line in explanation_lines:
-                                if not first_line:
-                                    f.write("   ")
-                                f.write(f" {line.strip()}\n")
-                                first_line = False
-                        f.write("\n\n")
-                    else:
-                        f.write(f"**A{i+1}.** Error: Invalid correct answer index.\n\n")
+                    append(f"**A{i+1}.** {correct_option_letter}. {correct_option_text}\n")
+                    if explanation:
+                        # Continuation lines are indented to line up under the label
+                        append("   *Explanation:*")
+                        append("   ".join(f" {line.strip()}\n" for line in explanation.split('\n')))
+                    append("\n\n")
+                else:
+                    append(f"**A{i+1}.** Error: Invalid correct answer index.\n\n")
+            
+            with _atomic_open(filename) as f:
+                f.write("".join(parts))
             
             return True, export_path
             
@@ -273,44 +444,43 @@ class DatabaseManager:
         Returns:
             tuple: (success: bool, filepath: str)
         """
+        now = datetime.now()
         if filename is None:
-            filename = f"Linux_plus_QA_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filename = f"Linux_plus_QA_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
             export_path = os.path.abspath(filename)
             
-            # Prepare questions data for JSON export
-            questions_list = []
-            for i, q_data in enumerate(questions_data):
-                if len(q_data) < 5:
-                    continue
-                question_text, options, correct_answer_index, category, explanation = q_data
-                
-                question_obj = {
-                    "id": i + 1,
-                    "question": question_text,
-                    "category": category,
-                    "options": options,
-                    "correct_answer_index": correct_answer_index,
-                    "correct_answer_letter": chr(ord('A') + correct_answer_index) if 0 <= correct_answer_index < len(options) else "Invalid",
-                    "correct_answer_text": options[correct_answer_index] if 0 <= correct_answer_index < len(options) else "Invalid index",
-                    "explanation": explanation if explanation else ""
-                }
-                questions_list.append(question_obj)
-
-            # Create the final JSON structure
-            export_data = {
-                "metadata": {
-                    "title": "Linux+ Study Questions",
-                    "export_date": datetime.now().isoformat(),
-                    "total_questions": len(questions_list),
-                    "categories": sorted(list(set(q["category"] for q in questions_list)))
-                },
-                "questions": questions_list
+            # First pass: metadata only needs the count and categories
+            total_questions = 0
+            categories = set()
+            for q_data in questions_data:
+                if len(q_data) >= 5:
+                    total_questions += 1
+                    categories.add(q_data[3])
+            
+            metadata = {
+                "title": "Linux+ Study Questions",
+                "export_date": now.isoformat(),
+                "total_questions": total_questions,
+                "categories": sorted(categories)
             }
-
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            encode = _JSON_ENCODERS[True, False].encode
+            
+            # Second pass: write each question as it is built, in the same
+            # layout as an indent=2 dump (nested lines shifted to their depth)
+            with _atomic_open(filename) as f:
+                f.write('{\n  "metadata": ')
+                f.write(encode(metadata).replace('\n', '\n  '))
+                f.write(',\n  "questions": [')
+                written = 0
+                for i, q_data in enumerate(questions_data):
+                    if len(q_data) < 5:
+                        continue
+                    f.write(',\n    ' if written else '\n    ')
+                    f.write(encode(_question_export_dict(i, q_data[:5])).replace('\n', '\n    '))
+                    written += 1
+                f.write('\n  ]\n}' if written else ']\n}')
             
             return True, export_path
             
@@ -340,12 +510,12 @@ class DatabaseManager:
             bool: True if backup created successfully
         """
         try:
-            if os.path.isfile(filepath):
-                backup_path = filepath + backup_suffix
-                import shutil
-                shutil.copy2(filepath, backup_path)
-                return True
-            return False
+            # A missing source means there is nothing to back up
+            if not os.path.isfile(filepath):
+                return False
+            # copy2 uses os.sendfile on Linux, so the data never passes through Python
+            shutil.copy2(filepath, filepath + backup_suffix)
+            return True
         except Exception as e:
             print(f"{COLOR_ERROR} Error creating backup: {e} {COLOR_RESET}")
             return False
\ No newline at end of file
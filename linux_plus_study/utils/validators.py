@@ -6,12 +6,22 @@ Handles input validation, data validation, and user choice validation.
 
 import os
 import re
-from utils.config import COLOR_INFO, COLOR_ERROR, COLOR_RESET
+from utils.config import (
+    COLOR_INFO, COLOR_ERROR, COLOR_RESET, QUIZ_MODE_STANDARD, QUIZ_MODE_VERIFY
+)
 
 
 class InputValidator:
     """Handles validation of user inputs and data structures."""
     
+    # Characters rejected in export filenames, matched in one regex scan
+    _INVALID_FILENAME_CHARS = ['<', '>', ':', '"', '|', '?', '*']
+    _INVALID_FILENAME_RE = re.compile('[' + re.escape(''.join(_INVALID_FILENAME_CHARS)) + ']')
+    
+    # Accepted yes/no answers
+    _YES_RESPONSES = frozenset(('yes', 'y', 'true', '1'))
+    _NO_RESPONSES = frozenset(('no', 'n', 'false', '0'))
+    
     @staticmethod
     def validate_quiz_answer(user_input, num_options, allow_skip=True, allow_quit=True):
         """
@@ -112,12 +122,9 @@ class InputValidator:
             return True, default.lower() == 'yes', ""
         
         # Check valid yes/no responses
-        yes_responses = ['yes', 'y', 'true', '1']
-        no_responses = ['no', 'n', 'false', '0']
-        
-        if cleaned_input in yes_responses:
+        if cleaned_input in InputValidator._YES_RESPONSES:
             return True, True, ""
-        elif cleaned_input in no_responses:
+        elif cleaned_input in InputValidator._NO_RESPONSES:
             return True, False, ""
         else:
             return False, None, "Please enter 'yes' or 'no'"
@@ -165,9 +172,8 @@ class InputValidator:
             return False, None, "Filename cannot be empty"
         
         # Check for invalid characters (basic check)
-        invalid_chars = ['<', '>', ':', '"', '|', '?', '*']
-        if any(char in cleaned_filename for char in invalid_chars):
-            return False, None, f"Filename contains invalid characters: {invalid_chars}"
+        if InputValidator._INVALID_FILENAME_RE.search(cleaned_filename):
+            return False, None, f"Filename contains invalid characters: {InputValidator._INVALID_FILENAME_CHARS}"
         
         # Add required extension if specified and missing
         if required_extension:
@@ -208,6 +214,20 @@ class InputValidator:
 class DataValidator:
     """Handles validation of data structures and game state."""
     
+    # str.translate table deleting control characters except tab, newline and CR
+    _CONTROL_CHAR_TABLE = dict.fromkeys(i for i in range(32) if chr(i) not in '\t\n\r')
+    
+    # Valid quiz modes; the list keeps display order for error messages
+    _QUIZ_MODES_ORDER = [
+        QUIZ_MODE_STANDARD, 
+        QUIZ_MODE_VERIFY, 
+        "quick_fire", 
+        "mini_quiz", 
+        "daily_challenge", 
+        "pop_quiz"
+    ]
+    _QUIZ_MODES = frozenset(_QUIZ_MODES_ORDER)
+    
     @staticmethod
     def validate_question_data(question_data):
         """
@@ -331,21 +351,10 @@ class DataValidator:
         Returns:
             tuple: (is_valid: bool, error_message: str)
         """
-        from utils.config import QUIZ_MODE_STANDARD, QUIZ_MODE_VERIFY
-        
-        valid_modes = [
-            QUIZ_MODE_STANDARD, 
-            QUIZ_MODE_VERIFY, 
-            "quick_fire", 
-            "mini_quiz", 
-            "daily_challenge", 
-            "pop_quiz"
-        ]
-        
-        if mode in valid_modes:
+        if isinstance(mode, str) and mode in DataValidator._QUIZ_MODES:
             return True, ""
         else:
-            return False, f"Invalid quiz mode. Must be one of: {valid_modes}"
+            return False, f"Invalid quiz mode. Must be one of: {DataValidator._QUIZ_MODES_ORDER}"
 
     @staticmethod
     def sanitize_input(user_input, max_length=1000):
@@ -362,13 +371,8 @@ class DataValidator:
         if not isinstance(user_input, str):
             return ""
         
-        # Truncate if too long
-        sanitized = user_input[:max_length]
-        
-        # Remove control characters except common whitespace
-        sanitized = ''.join(char for char in sanitized if ord(char) >= 32 or char in '\t\n\r')
-        
-        return sanitized
+        # Truncate if too long, then remove control characters except common whitespace
+        return user_input[:max_length].translate(DataValidator._CONTROL_CHAR_TABLE)
 
     @staticmethod
     def validate_file_path(file_path, must_exist=False, must_be_writable=False):
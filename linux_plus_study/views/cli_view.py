@@ -17,7 +17,7 @@ from utils.config import (
     COLOR_BORDER, COLOR_INPUT, COLOR_ERROR, COLOR_WARNING, COLOR_INFO,
     COLOR_WELCOME_BORDER, COLOR_WELCOME_TEXT, COLOR_WELCOME_TITLE,
     COLOR_RESET, C, QUIZ_MODE_STANDARD, QUIZ_MODE_VERIFY,
-    QUICK_FIRE_QUESTIONS, QUICK_FIRE_TIME_LIMIT, MINI_QUIZ_QUESTIONS
+    QUICK_FIRE_QUESTIONS, QUICK_FIRE_TIME_LIMIT, MINI_QUIZ_QUESTIONS, wrap
 )
 
 
@@ -36,15 +36,15 @@ def cli_print_welcome():
 
 def cli_print_error(message):
     """Prints an error message in red."""
-    print(f"{COLOR_ERROR}Error: {message}{COLOR_RESET}")
+    print(wrap("error", f"Error: {message}"))
 
 def cli_print_info(message):
     """Prints an informational message in cyan."""
-    print(f"{COLOR_INFO}{message}{COLOR_RESET}")
+    print(wrap("info", message))
 
 def cli_print_warning(message):
     """Prints a warning message in bold yellow."""
-    print(f"{COLOR_WARNING}Warning: {message}{COLOR_RESET}")
+    print(wrap("warning", f"Warning: {message}"))
 
 def cli_print_header(text, char='=', length=60, color=COLOR_HEADER):
     """Prints a centered header with separators."""
@@ -235,11 +235,12 @@ class LinuxPlusStudyCLI:
             return
         _, options, correct_answer_index, category, explanation = question_data
         
-        if original_index < 0 or original_index >= len(self.game_logic.questions):
+        original_question = self.game_logic.question_manager.get_question_by_index(original_index)
+        if original_question is None:
             cli_print_error("Invalid original index for feedback.")
             original_question_text = "Unknown Question"
         else:
-            original_question_text = self.game_logic.questions[original_index][0]
+            original_question_text = original_question.text
 
         is_correct = (user_answer_index == correct_answer_index)
 
@@ -443,11 +444,7 @@ class LinuxPlusStudyCLI:
                 return
 
         # Determine total questions for display
-        max_available_for_filter = 0
-        if category_filter is None:
-            max_available_for_filter = len(self.game_logic.questions)
-        else:
-            max_available_for_filter = sum(1 for q in self.game_logic.questions if len(q) > 3 and q[3] == category_filter)
+        max_available_for_filter = self.game_logic.get_question_count(category_filter)
 
         total_questions_for_display_label = 0
         questions_to_ask_this_session = 0 
@@ -538,10 +535,11 @@ class LinuxPlusStudyCLI:
                 continue
             
             _, _, correct_answer_index, q_category, _ = question_data
-            if original_index < 0 or original_index >= len(self.game_logic.questions):
+            original_question = self.game_logic.question_manager.get_question_by_index(original_index)
+            if original_question is None:
                 original_question_text = "Error: Unknown Question Text" 
             else:
-                original_question_text = self.game_logic.questions[original_index][0] 
+                original_question_text = original_question.text
 
             is_correct = (user_answer == correct_answer_index)
 
@@ -828,14 +826,13 @@ class LinuxPlusStudyCLI:
         incorrect_list_copy = list(incorrect_list)
         questions_to_remove_from_history = []
 
+        questions_by_text = self.game_logic.get_question_tuples_by_text()
+
         for incorrect_text in incorrect_list_copy:
-            found = False
-            for q_data in self.game_logic.questions:
-                if isinstance(q_data, (list, tuple)) and len(q_data) > 0 and q_data[0] == incorrect_text:
-                    questions_to_review.append(q_data)
-                    found = True
-                    break
-            if not found:
+            q_data = questions_by_text.get(incorrect_text)
+            if q_data is not None:
+                questions_to_review.append(q_data)
+            else:
                 not_found_questions.append(incorrect_text)
                 print(f"{COLOR_WARNING} Could not find full data for question: {incorrect_text[:50]}... (Maybe removed from source?){COLOR_RESET}")
                 questions_to_remove_from_history.append(incorrect_text)
@@ -844,9 +841,10 @@ class LinuxPlusStudyCLI:
         history_changed = False
         if questions_to_remove_from_history:
             original_len = len(self.game_logic.study_history.get("incorrect_review", []))
+            remove_set = set(questions_to_remove_from_history)
             self.game_logic.study_history["incorrect_review"] = [
                 q_text for q_text in self.game_logic.study_history.get("incorrect_review", [])
-                if q_text not in questions_to_remove_from_history
+                if q_text not in remove_set
             ]
             if len(self.game_logic.study_history["incorrect_review"]) != original_len:
                 history_changed = True
@@ -1058,7 +1056,7 @@ class LinuxPlusStudyCLI:
         self.clear_screen()
         cli_print_header("Export Questions & Answers to Markdown")
 
-        if not self.game_logic.questions:
+        if not self.game_logic.get_question_count():
             print(f"\n{COLOR_WARNING}No questions are currently loaded to export.{COLOR_RESET}")
             try: 
                 input(f"\n{COLOR_PROMPT}Press Enter to return to the main menu...{COLOR_RESET}")
@@ -1143,7 +1141,7 @@ class LinuxPlusStudyCLI:
         self.clear_screen()
         cli_print_header("Export Questions & Answers to JSON")
 
-        if not self.game_logic.questions:
+        if not self.game_logic.get_question_count():
             print(f"\n{COLOR_WARNING}No questions are currently loaded to export.{COLOR_RESET}")
             try: 
                 input(f"\n{COLOR_PROMPT}Press Enter to return to the main menu...{COLOR_RESET}")
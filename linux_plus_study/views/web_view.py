@@ -14,7 +14,6 @@ from datetime import datetime
 import hashlib
 import time
 import logging
-import traceback
 from utils.cli_playground import get_cli_playground
 import subprocess
 import shlex
@@ -26,7 +25,7 @@ from werkzeug.utils import secure_filename
 import tempfile
 import mimetypes
 
-cli_playground = get_cli_playground()
+logger = logging.getLogger(__name__)
 
 class LinuxPlusStudyWeb:
     """Web interface using Flask + pywebview for desktop app experience."""
@@ -187,7 +186,7 @@ class LinuxPlusStudyWeb:
         def get_available_commands():
             """Get list of available CLI commands"""
             try:
-                commands = list(cli_playground.safe_commands.keys())
+                commands = list(get_cli_playground().safe_commands.keys())
                 commands.sort()
                 
                 command_descriptions = {
@@ -293,7 +292,7 @@ class LinuxPlusStudyWeb:
         def export_qa_markdown():
             """Export questions and answers to Markdown format with proper download headers."""
             try:
-                if not self.game_state.questions:
+                if not self.game_state.get_question_count():
                     return jsonify({
                         'success': False, 
                         'message': 'No questions are currently loaded to export.'
@@ -369,14 +368,15 @@ class LinuxPlusStudyWeb:
         def export_qa_json():
             """Export questions and answers to JSON format with proper download headers."""
             try:
-                if not self.game_state.questions:
+                if not self.game_state.get_question_count():
                     return jsonify({
                         'success': False,
                         'message': 'No questions are currently loaded to export.'
                     }), 400
                 
                 # Generate filename with timestamp
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                now = datetime.now()
+                timestamp = now.strftime('%Y%m%d_%H%M%S')
                 filename = f"Linux_plus_QA_{timestamp}.json"
                 
                 # Prepare questions data for JSON export
@@ -402,7 +402,7 @@ class LinuxPlusStudyWeb:
                 export_data = {
                     "metadata": {
                         "title": "Linux+ Study Questions",
-                        "export_date": datetime.now().isoformat(),
+                        "export_date": now.isoformat(),
                         "total_questions": len(questions_data),
                         "categories": sorted(list(set(q["category"] for q in questions_data)))
                     },
@@ -765,8 +765,8 @@ class LinuxPlusStudyWeb:
         Returns:
             Tuple[List[dict], dict]: (filtered_questions, duplicate_report)
         """
-        existing_questions = [q[0] if isinstance(q, (list, tuple)) else q.get('text', '') 
-                            for q in self.game_state.questions]
+        # Only the lowercased texts are needed; lower them once, not per comparison
+        existing_questions = [q.text.lower() for q in self.game_state.question_manager.questions]
         
         unique_questions = []
         duplicates_found = 0
@@ -778,7 +778,7 @@ class LinuxPlusStudyWeb:
             # Check against existing questions
             is_duplicate = False
             for existing_text in existing_questions:
-                if self._is_similar_question(question_text, existing_text.lower()):
+                if self._is_similar_question(question_text, existing_text):
                     is_duplicate = True
                     break
             
@@ -964,13 +964,6 @@ class LinuxPlusStudyWeb:
             if not category or not category.strip():
                 category = "General"
             
-            # Add to game state
-            validated_tuple = (text.strip(), list(options), int(correct_index), 
-                             category.strip(), explanation.strip())
-            
-            # Add to questions list
-            self.game_state.questions.append(validated_tuple)
-            
             # Update categories
             self.game_state.categories.add(category.strip())
             
@@ -979,111 +972,14 @@ class LinuxPlusStudyWeb:
                 from models.question import Question
                 question_obj = Question(text.strip(), list(options), int(correct_index), 
                                       category.strip(), explanation.strip())
-                self.game_state.question_manager.questions.append(question_obj)
-                self.game_state.question_manager.categories.add(category.strip())
+                self.game_state.question_manager.add_question(question_obj)
             
             return True
             
         except Exception as e:
             print(f"Error adding question to pool: {str(e)}")
             return False
-    def _simulate_command(self, command):
-        """Simulate common commands with educational examples"""
-        
-        # Create sample files content
-        sample_files = {
-            'sample.txt': 'Hello Linux Plus student!\nThis is a sample text file.\nPractice your command line skills here.\nGood luck with your certification!',
-            'log.txt': 'INFO: System started\nERROR: Failed to connect\nINFO: Retrying connection\nWARNING: Low disk space\nINFO: Connection established',
-            'data.csv': 'name,age,city\nJohn,25,New York\nJane,30,Los Angeles\nBob,35,Chicago',
-            'config.conf': '[database]\nhost=localhost\nport=5432\nname=mydb\n\n[logging]\nlevel=INFO\nfile=/var/log/app.log'
-        }
-        
-        cmd_parts = command.split()
-        if not cmd_parts:
-            return None
-        
-        base_cmd = cmd_parts[0]
-        
-        # Simulate ls command
-        if base_cmd == 'ls':
-            if len(cmd_parts) == 1:
-                return 'sample.txt  log.txt  data.csv  config.conf  docs/  scripts/'
-            else:
-                return 'sample.txt  log.txt  data.csv  config.conf'
-        
-        # Simulate cat command
-        elif base_cmd == 'cat' and len(cmd_parts) > 1:
-            filename = cmd_parts[1]
-            if filename in sample_files:
-                return sample_files[filename]
-            else:
-                return f'cat: {filename}: No such file or directory'
-        
-        # Simulate grep command
-        elif base_cmd == 'grep' and len(cmd_parts) >= 3:
-            pattern = cmd_parts[1].strip('"\'')
-            filename = cmd_parts[2]
-            if filename in sample_files:
-                lines = sample_files[filename].split('\n')
-                matches = [line for line in lines if pattern.lower() in line.lower()]
-                return '\n'.join(matches) if matches else f'grep: no matches found for "{pattern}"'
-            else:
-                return f'grep: {filename}: No such file or directory'
-        
-        # Simulate wc command
-        elif base_cmd == 'wc' and len(cmd_parts) > 1:
-            filename = cmd_parts[1]
-            if filename in sample_files:
-                content = sample_files[filename]
-                lines = len(content.split('\n'))
-                words = len(content.split())
-                chars = len(content)
-                return f'{lines:8} {words:8} {chars:8} {filename}'
-            else:
-                return f'wc: {filename}: No such file or directory'
-        
-        return None  # Command not simulated, try real execution
-
-    def _get_help_text(self):
-        """Get comprehensive help text"""
-        return """Linux Plus CLI Playground - Available Commands:
-
-    FILE OPERATIONS:
-    ls                    - List files and directories
-    cat <file>           - Display file contents
-    head <file>          - Show first 10 lines of file
-    tail <file>          - Show last 10 lines of file
-
-    TEXT PROCESSING:
-    grep <pattern> <file> - Search for pattern in file
-    wc <file>            - Count lines, words, and characters
-
-    SYSTEM INFO:
-    pwd                  - Show current directory path
-    whoami              - Display current username
-    date                - Show current date and time
-
-    UTILITIES:
-    echo "text"         - Display text
-    find . -name "*.txt" - Find files by pattern
-    clear               - Clear terminal screen
-    help                - Show this help message
-
-    SAMPLE FILES AVAILABLE:
-    sample.txt          - Basic text file
-    log.txt             - Log file with different message types
-    data.csv            - CSV data file
-    config.conf         - Configuration file
-
-    EXAMPLES:
-    cat sample.txt              - View sample file
-    grep "ERROR" log.txt        - Find error messages
-    wc data.csv                 - Count lines in CSV
-    echo "Hello World"          - Print text
-    find . -name "*.txt"        - Find all .txt files
 
-    This is a safe educational environment. Not all Linux commands are available.
-    Type commands above to practice Linux command line skills!"""
     def reset_quiz_state(self):
         """Reset quiz state variables."""
         self.quiz_active = False
@@ -1128,7 +1024,7 @@ class LinuxPlusStudyWeb:
                 status = self.quiz_controller.get_session_status()
                 return jsonify({
                     'quiz_active': status['quiz_active'],
-                    'total_questions': len(self.game_state.questions),
+                    'total_questions': self.game_state.get_question_count(),
                     'categories': sorted(list(self.game_state.categories)),
                     'session_score': status['session_score'],
                     'session_total': status['session_total'],
@@ -1140,7 +1036,7 @@ class LinuxPlusStudyWeb:
             except Exception as e:
                 return jsonify({
                     'quiz_active': False,
-                    'total_questions': len(self.game_state.questions),
+                    'total_questions': self.game_state.get_question_count(),
                     'categories': sorted(list(self.game_state.categories)),
                     'session_score': 0,
                     'session_total': 0,
@@ -1434,16 +1330,17 @@ class LinuxPlusStudyWeb:
             try:
                 from flask import make_response
                 
+                now = datetime.now()
                 export_data = self.game_state.study_history.copy()
                 export_data["export_metadata"] = {
-                    "export_date": datetime.now().isoformat(),
-                    "total_questions_in_pool": len(self.game_state.questions),
+                    "export_date": now.isoformat(),
+                    "total_questions_in_pool": self.game_state.get_question_count(),
                     "categories_available": list(self.game_state.categories)
                 }
                 
                 response = make_response(json.dumps(export_data, indent=2))
                 response.headers['Content-Type'] = 'application/json'
-                response.headers['Content-Disposition'] = f'attachment; filename=linux_plus_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+                response.headers['Content-Disposition'] = f'attachment; filename=linux_plus_export_{now.strftime("%Y%m%d_%H%M%S")}.json'
                 
                 return response
             except Exception as e:
@@ -1512,7 +1409,7 @@ class LinuxPlusStudyWeb:
         def get_question_count():
             """Get the current number of questions available."""
             try:
-                count = len(self.game_state.questions)
+                count = self.game_state.get_question_count()
                 return jsonify({
                     'success': True,
                     'count': count
@@ -1528,8 +1425,7 @@ class LinuxPlusStudyWeb:
             try:
                 return f(*args, **kwargs)
             except Exception as e:
-                logging.error(f"API Error in {f.__name__}: {str(e)}")
-                logging.error(traceback.format_exc())
+                logger.exception("API Error in %s: %s", f.__name__, e)
                 return jsonify({
                     'error': f'Server error: {str(e)}',
                     'success': False
@@ -1538,13 +1434,13 @@ class LinuxPlusStudyWeb:
         return wrapper
     def _get_help_text(self):
         """Get help text for CLI playground commands."""
-        help_func = cli_playground.safe_commands.get('help', lambda args: "No help available")
+        help_func = get_cli_playground().safe_commands.get('help', lambda args: "No help available")
         return help_func([])  # Pass empty args list
 
     def _simulate_command(self, command):
         """Simulate command execution using the CLI playground."""
         try:
-            return cli_playground.process_command(command)
+            return get_cli_playground().process_command(command)
         except Exception as e:
             return f"Error executing command: {str(e)}"
     